@@ -47,17 +47,17 @@ def calculate_transfer_batch(
                 shot.edit_media_range and shot.edit_media_range.duration.value > 0):
             # Log reason for skipping if not already logged by finder
             if shot.lookup_status != 'found':
-                logger.debug(f"Skipping '{shot.clip_name}': Status not 'found'.")
+                logger.debug("Skipping '%s': Status not 'found'.", shot.clip_name)
             elif not shot.found_original_source:
-                logger.debug(f"Skipping '{shot.clip_name}': Missing linked original source.")
+                logger.debug("Skipping '%s': Missing linked original source.", shot.clip_name)
             elif not shot.found_original_source.is_verified:
-                logger.debug(f"Skipping '{shot.clip_name}': Original source not verified.")
+                logger.debug("Skipping '%s': Original source not verified.", shot.clip_name)
             elif not shot.found_original_source.duration:
-                logger.debug(f"Skipping '{shot.clip_name}': Original source missing duration.")
+                logger.debug("Skipping '%s': Original source missing duration.", shot.clip_name)
             elif not shot.found_original_source.frame_rate:
-                logger.debug(f"Skipping '{shot.clip_name}': Original source missing frame rate.")
+                logger.debug("Skipping '%s': Original source missing frame rate.", shot.clip_name)
             elif not shot.edit_media_range or shot.edit_media_range.duration.value <= 0:
-                logger.debug(f"Skipping '{shot.clip_name}': Invalid edit range.")
+                logger.debug("Skipping '%s': Invalid edit range.", shot.clip_name)
 
             if shot not in batch.unresolved_shots: batch.unresolved_shots.append(shot)
             continue
@@ -101,8 +101,8 @@ def calculate_transfer_batch(
                     start_time=original_absolute_start_time,
                     duration=original_duration
                 )
-                logger.debug(f"  Shot '{shot.clip_name}': Edit range {shot.edit_media_range} "
-                             f"-> Approx Original range (no handles) {original_range_no_handles}")
+                logger.debug("  Shot '%s': Edit range %s -> Approx Original range (no handles) %s",
+                             shot.clip_name, shot.edit_media_range, original_range_no_handles)
 
                 # --- Apply Handles & Clamp ---
                 start_h, end_h_exc = handle_utils.apply_handles_to_range(
@@ -115,8 +115,8 @@ def calculate_transfer_batch(
                 clamped_start = max(source_start_tc, start_h)
                 clamped_end_exc = min(source_start_tc + source_duration, end_h_exc)
 
-                if clamped_start != start_h: logger.debug(f"  Shot '{shot.clip_name}': Start handle clamped.")
-                if clamped_end_exc != end_h_exc: logger.debug(f"  Shot '{shot.clip_name}': End handle clamped.")
+                if clamped_start != start_h: logger.debug("  Shot '%s': Start handle clamped.", shot.clip_name)
+                if clamped_end_exc != end_h_exc: logger.debug("  Shot '%s': End handle clamped.", shot.clip_name)
 
                 final_duration = clamped_end_exc - clamped_start
                 if final_duration.value <= 0:
@@ -128,7 +128,7 @@ def calculate_transfer_batch(
 
                 final_range_with_handles = opentime.TimeRange(clamped_start, final_duration)
                 handled_ranges_to_merge.append((final_range_with_handles, shot))
-                logger.debug(f"  Shot '{shot.clip_name}': Calculated handled range: {final_range_with_handles}")
+                logger.debug("  Shot '%s': Calculated handled range: %s", shot.clip_name, final_range_with_handles)
 
             except Exception as e:
                 msg = f"Error processing range for shot '{shot.clip_name}': {e}"
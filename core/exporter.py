@@ -165,7 +165,7 @@ def export_transfer_batch(
         try:
             video_track.append(otio_clip)
             added_clip_count += 1
-            logger.debug(f"Added clip '{otio_clip.name}' -> Src: {original_source.path}, Src Range: {transfer_range}")
+            logger.debug("Added clip '%s' -> Src: %s, Src Range: %s", otio_clip.name, original_source.path, transfer_range)
         except Exception as append_err:
             logger.error(f"Failed to append clip '{otio_clip.name}' to track: {append_err}", exc_info=True)
             return False  # Fail export if clip cannot be appended
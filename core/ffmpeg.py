@@ -73,7 +73,7 @@ def generate_ffmpeg_command(
     # Add output path
     command.append(output_path)
 
-    logger.debug(f"Generated FFmpeg command: {' '.join(command)}")
+    logger.debug("Generated FFmpeg command: %s", ' '.join(command))
     return command
 
 
@@ -169,7 +169,7 @@ class FFmpegRunner:
 
                 try:
                     # Execute blocking call (replace with non-blocking later)
-                    logger.debug(f"Executing: {' '.join(command)}")
+                    logger.debug("Executing: %s", ' '.join(command))
                     process = subprocess.Popen(
                         command,
                         stdout=subprocess.PIPE, stderr=subprocess.PIPE,
@@ -114,7 +114,7 @@ def read_and_parse_edit_file(file_path: str) -> Tuple[List[EditShot], Optional[s
             media_ref = clip.media_reference
             # --- Clip and Media Reference Validation ---
             if not media_ref:
-                logger.debug(f"Skipping clip #{clip_counter} ('{clip.name}'): No media reference.")
+                logger.debug("Skipping clip #%d ('%s'): No media reference.", clip_counter, clip.name)
                 skipped_counter += 1
                 continue
             if not isinstance(media_ref, otio.schema.ExternalReference):
@@ -164,7 +164,7 @@ def read_and_parse_edit_file(file_path: str) -> Tuple[List[EditShot], Optional[s
                 lookup_status="pending"
             )
             edit_shots.append(shot)
-            logger.debug(f"Parsed EditShot #{len(edit_shots)} from clip '{shot.clip_name or 'Unnamed'}'")
+            logger.debug("Parsed EditShot #%d from clip '%s'", len(edit_shots), shot.clip_name or 'Unnamed')
 
     except Exception as e:
         # Catch errors during the clip iteration phase
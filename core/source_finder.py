@@ -47,7 +47,7 @@ def find_executable(name: str) -> Optional[str]:
     # --- 1. Check if bundled (PyInstaller) ---
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         bundle_dir = sys._MEIPASS
-        logger.debug(f"Running bundled, checking base bundle dir: {bundle_dir}")
+        logger.debug("Running bundled, checking base bundle dir: %s", bundle_dir)
         exe_path = os.path.join(bundle_dir, executable_name)
         if os.path.exists(exe_path):
             found_path = exe_path
@@ -83,14 +83,14 @@ def find_executable(name: str) -> Optional[str]:
 
         relative_subfolder = "ffmpeg_bin"  # Conventional name for local binaries
         exe_path = os.path.join(base_dir, relative_subfolder, executable_name)
-        logger.debug(f"Checking relative conventional subfolder: {exe_path}")
+        logger.debug("Checking relative conventional subfolder: %s", exe_path)
         if os.path.exists(exe_path):
             found_path = exe_path
             logger.info(f"Found '{name}' in relative subfolder '{relative_subfolder}'.")
 
     # --- 3. Fallback to system PATH ---
     if not found_path:
-        logger.debug(f"'{name}' not found in bundle or relative subfolder, checking system PATH.")
+        logger.debug("'%s' not found in bundle or relative subfolder, checking system PATH.", name)
         exe_path = shutil.which(name)
         if exe_path:
             found_path = exe_path
@@ -102,7 +102,7 @@ def find_executable(name: str) -> Optional[str]:
 
     # Return the absolute path
     abs_found_path = os.path.abspath(found_path)
-    logger.debug(f"'{name}' final path determined as: {abs_found_path}")
+    logger.debug("'%s' final path determined as: %s", name, abs_found_path)
     return abs_found_path
 
 
@@ -153,7 +153,7 @@ class SourceFinder:
         Returns:
             An OriginalSourceFile object if found and verified, otherwise None.
         """
-        logger.debug(f"Finding source for EditShot: '{edit_shot.clip_name}' (Edit media: {edit_shot.edit_media_path})")
+        logger.debug("Finding source for EditShot: '%s' (Edit media: %s)", edit_shot.clip_name, edit_shot.edit_media_path)
 
         # Cannot proceed without ffprobe for verification
         if not self.ffprobe_path:
@@ -178,11 +178,11 @@ class SourceFinder:
 
         # --- Step 2: Check Cache ---
         if abs_candidate_path in self.verified_cache:
-            logger.debug(f"Found verified source in cache: {abs_candidate_path}")
+            logger.debug("Found verified source in cache: %s", abs_candidate_path)
             return self.verified_cache[abs_candidate_path]
 
         # --- Step 3: Verify the candidate file using ffprobe ---
-        logger.debug(f"Verifying candidate path: {abs_candidate_path}")
+        logger.debug("Verifying candidate path: %s", abs_candidate_path)
         verified_info = self._verify_source_with_ffprobe(abs_candidate_path)
 
         if verified_info:
@@ -228,7 +228,7 @@ class SourceFinder:
                 logger.warning(f"Could not extract base name stem from proxy path: {edit_shot.edit_media_path}")
                 return None
 
-            logger.debug(f"Searching for original source matching stem: '{proxy_name_stem}'")
+            logger.debug("Searching for original source matching stem: '%s'", proxy_name_stem)
 
             for search_dir in self.search_paths:
                 # logger.debug(f"Checking directory: {search_dir}") # Can be very verbose
@@ -250,7 +250,7 @@ class SourceFinder:
                 except Exception as e:
                     logger.error(f"Unexpected error searching directory '{search_dir}': {e}", exc_info=True)
 
-            logger.debug(f"No match found for stem '{proxy_name_stem}' in configured search paths.")
+            logger.debug("No match found for stem '%s' in configured search paths.", proxy_name_stem)
             return None  # No match found in any search path
 
         # --- Placeholder for other strategies ---
@@ -282,7 +282,7 @@ class SourceFinder:
 
         # Construct command using the found ffprobe path
         try:
-            logger.debug(f"Running ffprobe command on: {os.path.basename(file_path)}")
+            logger.debug("Running ffprobe command on: %s", os.path.basename(file_path))
             command = [
                 self.ffprobe_path,
                 '-v', 'error',
@@ -507,7 +507,7 @@ class TimelineHarvester:
             # --- Helper to Deserialize Transfer Batch ---
             def deserialize_batch(batch_data: Optional[Dict], stage: str) -> Optional[TransferBatch]:
                 if not batch_data or not isinstance(batch_data, dict): return None
-                logger.debug(f"Deserializing transfer batch for stage: {stage}")
+                logger.debug("Deserializing transfer batch for stage: %s", stage)
                 # Use handles specific to the stage being loaded
                 handles = self.color_prep_handles if stage == 'color' else self.online_prep_handles
                 # Use output dir specific to the stage
@@ -666,24 +666,24 @@ class TimelineHarvester:
         batch = self.color_transfer_batch if stage == 'color' else self.online_transfer_batch
         if not batch: return []
         summary = []
+        basenames = {}  # Segments mostly share a few sources; split each path once
         for i, seg in enumerate(batch.segments):
-            tc_string = "N/A"
+            source_path = seg.original_source.path
+            source_basename = basenames.get(source_path)
+            if source_basename is None:
+                source_basename = basenames[source_path] = os.path.basename(source_path)
             duration_sec = 0.0
             if seg.transfer_source_range:
                 duration_sec = seg.transfer_source_range.duration.to_seconds()
-                # Use rate from the *original source* associated with the segment
-                rate = seg.original_source.frame_rate
-                if rate:
-                    try:
-                        tc_string = seg.transfer_source_range.start_time.to_timecode(rate=rate)
-                    except:
-                        tc_string = f"{seg.transfer_source_range.start_time.to_seconds():.3f}s"
             summary.append({
                 "index": i + 1,
-                "source_basename": os.path.basename(seg.original_source.path),
-                "source_path": seg.original_source.path,
-                "range_start_tc": tc_string,
+                "source_basename": source_basename,
+                "source_path": source_path,
+                # Raw start time, formatted by the GUI only when the cell is shown
+                "start_rt": seg.transfer_source_range.start_time if seg.transfer_source_range else None,
                 "duration_sec": duration_sec,
+                # Rate of the *original source* associated with the segment
+                "rate": seg.original_source.frame_rate,
                 "status": seg.status,  # Transcode status (pending, running, completed, failed)
                 "error": seg.error_message or "", })
         return summary
@@ -39,7 +39,7 @@ class FileListWidget(QWidget):
 
         self._init_ui()
         self._connect_signals()
-        logger.debug(f"FileListWidget '{self._title}' initialized.")
+        logger.debug("FileListWidget '%s' initialized.", self._title)
 
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
@@ -118,7 +118,7 @@ class FileListWidget(QWidget):
                     else:
                         logger.warning(f"Path selected does not exist: {path}")
                 else:
-                     logger.debug(f"Path already in list: {path}")
+                     logger.debug("Path already in list: %s", path)
 
             if added_count > 0:
                 logger.info(f"Added {added_count} new path(s) to '{self._title}'.")
@@ -171,7 +171,7 @@ class FileListWidget(QWidget):
 
     def set_paths(self, paths: List[str]):
         """Sets the list of paths, validates them, and updates the UI."""
-        logger.debug(f"Setting paths for '{self._title}'.")
+        logger.debug("Setting paths for '%s'.", self._title)
         valid_paths = []
         check_func = os.path.isdir if self._select_directory else os.path.isfile
         for p in paths:
@@ -0,0 +1,235 @@
+# gui/common/summary_table_model.py
+"""
+Table model for displaying summary rows (lists of dicts produced by
+TimelineHarvester.get_*_summary) in a QTableView.
+
+Rows are kept as-is; Qt pulls text, colors and tooltips on demand
+for the cells it actually paints. Filter text is only built once a
+filter is applied.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtGui import QBrush, QColor
+
+from utils.time_utils import format_time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SummaryColumn:
+    """Describes how one column of a summary table is read from a row dict."""
+    header: str
+    key: str  # Key in the summary dict
+    default: Any = 'N/A'  # Shown when the key is missing
+    fmt: Optional[Callable[[Dict], str]] = None  # Builds the display text from the whole row
+    tooltip: Optional[Callable[[Dict], Optional[str]]] = None  # Builds the hover text from the whole row
+    alignment: Optional[int] = None  # Qt alignment flags for the cell text
+    is_time: bool = False  # Value is a RationalTime, shown as timecode at the row's 'rate'
+
+
+class SummaryTableModel(QAbstractTableModel):
+    """Read-only model over a list of summary dicts, colored by row 'status'."""
+
+    def __init__(self, columns: List[SummaryColumn], status_colors: Dict[str, QColor], parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            columns: Column definitions, in display order.
+            status_colors: Map of status string -> row background color.
+                           The 'default' entry is used for unknown statuses.
+            parent: Parent QObject.
+        """
+        super().__init__(parent)
+        self._columns = columns
+        # Display text function per column, so data() does no per-cell dispatch
+        self._text_getters = [self._text_getter(column) for column in columns]
+        # Brushes are built once and shared by every cell of a row with that status
+        self._status_brushes = {status: QBrush(color) for status, color in status_colors.items()}
+        self._default_brush = self._status_brushes.get("default") or QBrush(QColor(Qt.white))
+        self._rows: List[Dict] = []
+        # Lowercased cell text for filtering, built on the first filter after a load
+        self._filter_cols: Optional[List[List[str]]] = None
+        self._filter_blobs: Optional[List[str]] = None
+        # Sort keys per column, built on first sort by that column
+        self._sort_keys: Dict[int, List[Any]] = {}
+
+    # --- Public Methods ---
+
+    def set_rows(self, rows: List[Dict]):
+        """Replaces all rows in a single model reset."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._sort_keys = {}
+        self._filter_cols = self._filter_blobs = None  # Rebuilt lazily, most loads are never filtered
+        self.endResetModel()
+        logger.debug("SummaryTableModel loaded %d rows.", len(self._rows))
+
+    def clear(self):
+        """Removes all rows."""
+        self.set_rows([])
+
+    def row_data(self, row: int) -> Dict:
+        """Returns the summary dict backing the given source row."""
+        return self._rows[row]
+
+    def filter_string(self, row: int, column: int = -1) -> str:
+        """Returns the lowercased text of one cell, or of the whole row when column is -1."""
+        if self._filter_cols is None:
+            self._build_filter_strings()
+        if column < 0:
+            return self._filter_blobs[row]
+        return self._filter_cols[column][row]
+
+    def get_row_brush(self, row_data: Dict) -> QBrush:
+        """Returns the shared background brush for the row's status."""
+        return self._status_brushes.get(row_data.get('status'), self._default_brush)
+
+    def column_headers(self) -> List[str]:
+        return [column.header for column in self._columns]
+
+    # --- QAbstractTableModel Interface ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._columns):
+            return self._columns[section].header
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row_data = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self._text_getters[index.column()](row_data)
+        column = self._columns[index.column()]
+
+        if role == Qt.BackgroundRole:
+            return self.get_row_brush(row_data)
+        if role == Qt.ToolTipRole and column.tooltip:
+            return column.tooltip(row_data)
+        if role == Qt.TextAlignmentRole and column.alignment is not None:
+            return int(column.alignment)
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """
+        Reorders the rows by one column.
+
+        Keys are computed once per column and sorted in a single sorted()
+        call, instead of Qt comparing two data() lookups per step.
+        """
+        if not 0 <= column < len(self._columns) or len(self._rows) < 2:
+            return
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            key_of = self._sort_key_getter(self._columns[column])
+            keys = self._sort_keys[column] = [key_of(row_data) for row_data in self._rows]
+        new_order = sorted(range(len(self._rows)), key=keys.__getitem__,
+                           reverse=(order == Qt.DescendingOrder))
+
+        self.layoutAboutToBeChanged.emit()
+        self._rows = [self._rows[i] for i in new_order]
+        if self._filter_cols is not None:
+            self._filter_cols = [[cells[i] for i in new_order] for cells in self._filter_cols]
+            self._filter_blobs = [self._filter_blobs[i] for i in new_order]
+        self._sort_keys = {col: [col_keys[i] for i in new_order] for col, col_keys in self._sort_keys.items()}
+        # Keep selection and current index on the same rows
+        new_positions = [0] * len(new_order)
+        for new_row, old_row in enumerate(new_order):
+            new_positions[old_row] = new_row
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [self.index(new_positions[index.row()], index.column())
+                                                     for index in old_indexes])
+        self.layoutChanged.emit()
+
+    def _sort_key_getter(self, column: SummaryColumn) -> Callable[[Dict], Any]:
+        """Returns a function giving the sort key of this column for a row.
+
+        Numbers order by value, times by seconds and text case-insensitively.
+        """
+        key = column.key
+        if column.is_time:
+            def time_key(row_data: Dict):
+                value = row_data.get(key)
+                # Times shown as 'N/A' (no value or no rate) sort first
+                return 0, value.to_seconds() if value is not None and row_data.get('rate') else -1.0
+            return time_key
+        text_of = self._text_getter(column)
+
+        def value_key(row_data: Dict):
+            value = row_data.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return 0, value
+            return 1, text_of(row_data).lower()
+        return value_key
+
+    def _build_filter_strings(self):
+        rows = self._rows
+        self._filter_cols = []
+        for text_of in self._text_getters:
+            # Statuses and source names repeat across rows; lowercase each distinct
+            # text once and share the resulting string between those rows
+            lowered = {}
+            cells = []
+            for row_data in rows:
+                text = text_of(row_data)
+                cell = lowered.get(text)
+                if cell is None:
+                    cell = lowered[text] = text.lower()
+                cells.append(cell)
+            self._filter_cols.append(cells)
+        # Unit separator keeps a match from spanning two cells
+        self._filter_blobs = ['\x1f'.join(cells) for cells in zip(*self._filter_cols)]
+
+    def _text_getter(self, column: SummaryColumn) -> Callable[[Dict], str]:
+        """Returns a function giving the display text of this column for a row.
+
+        The column's kind (time, formatted or plain) is resolved once here
+        instead of being re-checked for every cell.
+        """
+        key = column.key
+        if column.is_time:
+            return lambda row_data: format_time(row_data.get(key), row_data.get('rate'))
+        if column.fmt:
+            return column.fmt
+        default = column.default
+        default_text = str(default)
+
+        def plain_text(row_data: Dict) -> str:
+            value = row_data.get(key, default)
+            return str(value) if value is not None else default_text
+        return plain_text
+
+
+class SummaryFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive substring filter over the strings precomputed by SummaryTableModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter_text = ""
+        self._filter_column = -1
+
+    def set_filter(self, text: str, column: int = -1):
+        """Sets the substring to match and the source column to match it in (-1 for all)."""
+        self._filter_text = text.lower()
+        self._filter_column = column
+        self.invalidateFilter()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Sorts in the source model; the proxy then only keeps the source order."""
+        self.sourceModel().sort(column, order)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._filter_text:
+            return True
+        return self._filter_text in self.sourceModel().filter_string(source_row, self._filter_column)
@@ -0,0 +1,191 @@
+# gui/common/summary_table_widget.py
+"""
+Reusable widget showing summary rows in a sortable QTableView
+with a text filter bar above it.
+"""
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
+                             QComboBox, QLabel, QTableView, QHeaderView,
+                             QAbstractItemView)
+
+from .summary_table_model import SummaryColumn, SummaryTableModel, SummaryFilterProxyModel
+
+logger = logging.getLogger(__name__)
+
+# Rows measured when sizing columns to their contents
+SIZE_SAMPLE_ROWS = 100
+# Extra width for cell margins and the sort indicator
+COLUMN_PADDING = 24
+# Extra height above and below a row's text
+ROW_PADDING = 6
+
+
+class SummaryTableWidget(QWidget):
+    """A filter bar plus table view over a SummaryTableModel."""
+
+    def __init__(self, columns: List[SummaryColumn], status_colors: Dict[str, QColor],
+                 stretch_columns: Iterable[int] = (), filter_debounce_ms: int = 250,
+                 default_sort_column: Optional[int] = None, default_sort_order: Qt.SortOrder = Qt.AscendingOrder,
+                 parent=None):
+        """
+        Initialize the widget.
+
+        Args:
+            columns: Column definitions passed to the model.
+            status_colors: Row background colors keyed by status.
+            stretch_columns: Indexes of columns that should take up spare width.
+            filter_debounce_ms: Delay after the last keystroke before the filter is applied.
+            default_sort_column: Column rows are sorted by when loaded, or None to keep the summary order.
+            default_sort_order: Order used with default_sort_column.
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self._stretch_columns = set(stretch_columns)
+        self._filter_debounce_ms = filter_debounce_ms
+        self._default_sort = (default_sort_column if default_sort_column is not None else -1, default_sort_order)
+        self._active_filter = ("", -1)  # (text, proxy column) currently applied
+
+        self.model = SummaryTableModel(columns, status_colors, self)
+        self.proxy = SummaryFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+
+        # Debounce filtering while the user is typing
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+
+        self._init_ui()
+        self._connect_signals()
+
+    def _init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)  # No margins for embedding
+
+        # Filter Bar
+        filter_layout = QHBoxLayout()
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_column_combo = QComboBox()
+        self.filter_column_combo.addItem("All Columns")
+        self.filter_column_combo.addItems(self.model.column_headers())
+        self.count_label = QLabel()
+        filter_layout.addWidget(self.filter_input, 1)
+        filter_layout.addWidget(self.filter_column_combo)
+        filter_layout.addWidget(self.count_label)
+        main_layout.addLayout(filter_layout)
+
+        # Table View
+        self.view = QTableView()
+        self.view.setModel(self.proxy)
+        self.view.setAlternatingRowColors(True)
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        vertical_header = self.view.verticalHeader()
+        vertical_header.setVisible(False)
+        # Every row is one line of text; a fixed height means rows are never measured
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.view.fontMetrics().height() + ROW_PADDING)
+        self.view.setShowGrid(True)
+        header = self.view.horizontalHeader()
+        # ResizeToContents re-measures rows on every change; size the other
+        # columns ourselves instead (see _fit_columns)
+        for i in range(self.model.columnCount()):
+            mode = QHeaderView.Stretch if i in self._stretch_columns else QHeaderView.Interactive
+            header.setSectionResizeMode(i, mode)
+        # Keep the summary order (or the default column) until the user clicks a header
+        header.setSortIndicator(*self._default_sort)
+        self.view.setSortingEnabled(True)
+        main_layout.addWidget(self.view, 1)
+
+        self._fit_columns()
+        self.update_count_label()
+
+    def _connect_signals(self):
+        self.filter_input.textChanged.connect(self._on_filter_changed)
+        # Return / leaving the field applies immediately, skipping the debounce
+        self.filter_input.returnPressed.connect(self._apply_filter_now)
+        self.filter_input.editingFinished.connect(self._apply_filter_now)
+        self.filter_column_combo.currentIndexChanged.connect(self._on_filter_column_changed)
+        self.filter_timer.timeout.connect(self._apply_filter)
+
+    # --- Filtering ---
+
+    @pyqtSlot(str)
+    def _on_filter_changed(self, text: str):
+        self.filter_timer.start(self._filter_debounce_ms)
+
+    @pyqtSlot()
+    def _apply_filter_now(self):
+        if self.filter_timer.isActive():
+            self.filter_timer.stop()
+            self._apply_filter()
+
+    @pyqtSlot(int)
+    def _on_filter_column_changed(self, index: int):
+        self._apply_filter()
+
+    @pyqtSlot()
+    def _apply_filter(self):
+        """Pushes the current filter text and column down to the proxy model."""
+        filter_text = self.filter_input.text().strip()
+        # Combo index 0 is "All Columns", which maps to proxy column -1
+        filter_column = self.filter_column_combo.currentIndex() - 1
+        if (filter_text, filter_column) == self._active_filter:
+            return  # Nothing changed, skip re-filtering every row
+        # Hold off repainting until the proxy has settled
+        self.view.setUpdatesEnabled(False)
+        try:
+            self.proxy.set_filter(filter_text, filter_column)
+        finally:
+            self.view.setUpdatesEnabled(True)
+        self._active_filter = (filter_text, filter_column)
+        self.update_count_label()
+
+    def _fit_columns(self):
+        """Sizes non-stretch columns once from the header and a sample of rows."""
+        metrics = self.view.fontMetrics()
+        header = self.view.horizontalHeader()
+        sample_rows = min(self.proxy.rowCount(), SIZE_SAMPLE_ROWS)
+        for col in range(self.model.columnCount()):
+            if col in self._stretch_columns:
+                continue
+            texts = [self.model.headerData(col, Qt.Horizontal)]
+            texts.extend(self.proxy.index(row, col).data() or "" for row in range(sample_rows))
+            header.resizeSection(col, max(metrics.horizontalAdvance(text) for text in texts) + COLUMN_PADDING)
+
+    def update_count_label(self):
+        total = self.model.rowCount()
+        visible = self.proxy.rowCount()
+        if visible == total:
+            self.count_label.setText(f"{total} rows")
+        else:
+            self.count_label.setText(f"{visible} of {total} rows")
+
+    # --- Public Methods ---
+
+    def set_rows(self, rows: List[Dict]):
+        """Replaces the table contents with the given summary rows."""
+        # Repaint once when the new rows are in place
+        self.view.setUpdatesEnabled(False)
+        try:
+            self.model.set_rows(rows)
+            # Rows arrive in summary order; put them in the order the header shows
+            header = self.view.horizontalHeader()
+            sort_column = header.sortIndicatorSection()
+            if 0 <= sort_column < self.model.columnCount():
+                self.model.sort(sort_column, header.sortIndicatorOrder())
+            self._fit_columns()
+        finally:
+            self.view.setUpdatesEnabled(True)
+        self.update_count_label()
+
+    def clear(self):
+        """Removes all rows from the table."""
+        self.model.clear()
+        self.update_count_label()
@@ -126,7 +126,7 @@ class FilePanel(QWidget):
                         else:
                             logger.warning(f"Selected file does not exist, skipping: {abs_path}")
                     else:
-                        logger.debug(f"Skipping already added file: {abs_path}")
+                        logger.debug("Skipping already added file: %s", abs_path)
 
                 if added_count > 0:
                     logger.info(f"Added {added_count} new edit file(s).")
@@ -177,7 +177,7 @@ class FilePanel(QWidget):
             item.setToolTip(file_path) # Show full path on hover
             self.file_list.addItem(item)
         self.update_button_states() # Ensure buttons reflect new state
-        logger.debug(f"File list UI updated. Items: {len(self._loaded_file_paths)}")
+        logger.debug("File list UI updated. Items: %d", len(self._loaded_file_paths))
 
     # --- Public Methods ---
     def get_loaded_files(self) -> List[str]:
@@ -38,7 +38,7 @@ logger = logging.getLogger(__name__)
 class WorkerThread(QThread):
     """Thread to run background tasks (analysis, plan, transcode) without freezing the GUI."""
     analysis_finished = pyqtSignal(list)
-    plan_finished = pyqtSignal(list, str)  # Added stage identifier
+    plan_finished = pyqtSignal(list, list, str)  # Segments, unresolved shots, stage
     transcode_finished = pyqtSignal(bool, str)
     progress_update = pyqtSignal(int, str)
     error_occurred = pyqtSignal(str)
@@ -77,7 +77,9 @@ class WorkerThread(QThread):
                 if not self._is_running: raise InterruptedError("Task stopped.")
                 # Get summary for the stage that was just calculated
                 segment_summary = self.harvester.get_transfer_segments_summary(stage=stage)
-                if self._is_running: self.plan_finished.emit(segment_summary, stage)  # Emit stage
+                # Built here too, so range formatting stays off the GUI thread
+                unresolved_summary = self.harvester.get_unresolved_shots_summary()
+                if self._is_running: self.plan_finished.emit(segment_summary, unresolved_summary, stage)
 
             elif self.task == 'transcode':  # Assumed Online for now
                 stage = self.params.get('stage', 'online')  # Get stage context
@@ -519,7 +521,7 @@ class MainWindow(QMainWindow):
         )
         # self.online_prep_tab.update_button_states(...) # Uncomment when implemented
 
-        logger.debug(f"UI actions/buttons state updated (Busy: {is_busy})")
+        logger.debug("UI actions/buttons state updated (Busy: %s)", is_busy)
 
     def _is_worker_busy(self) -> bool:
         """Checks if the worker thread is active and shows a message."""
@@ -745,10 +747,9 @@ class MainWindow(QMainWindow):
         logger.info(f"Analysis task completed. Sources found for {found_count}/{len(analysis_summary)} clips.")
         # Status bar/actions updated in on_task_finished
 
-    @pyqtSlot(list, str)  # Added stage argument
-    def on_plan_complete(self, plan_summary: List[Dict], stage: str):
+    @pyqtSlot(list, list, str)
+    def on_plan_complete(self, plan_summary: List[Dict], unresolved_summary: List[Dict], stage: str):
         """Handles successful completion of the 'create_plan' task."""
-        unresolved_summary = self.harvester.get_unresolved_shots_summary()
         errors = []
         batch = self.harvester.color_transfer_batch if stage == 'color' else self.harvester.online_transfer_batch
         if batch: errors = batch.calculation_errors
@@ -827,6 +828,7 @@ class MainWindow(QMainWindow):
         # TODO: Gather data from harvester and format a report string/file
 
     # --- About Dialog ---
+    @pyqtSlot()
     def show_about_dialog(self):
         QMessageBox.about(self, "About TimelineHarvester",
                           "<h2>TimelineHarvester</h2>"
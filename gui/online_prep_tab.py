@@ -51,7 +51,7 @@ class OnlinePrepTabWidget(QWidget):
     def load_tab_settings(self, settings: Dict):
         """Loads settings specific to this tab (does nothing yet)."""
         # No settings UI to load into yet
-        logger.debug(f"OnlinePrepTab settings load called (Placeholder): {settings}")
+        logger.debug("OnlinePrepTab settings load called (Placeholder): %s", settings)
         pass  # Ignore settings for now
 
     def get_tab_settings(self) -> Dict:
@@ -125,7 +125,7 @@ class ProjectPanel(QWidget):
 
     def load_panel_settings(self, settings: Dict):
         """Loads path lists from a settings dictionary."""
-        logger.debug(f"Loading ProjectPanel settings: {settings}")
+        logger.debug("Loading ProjectPanel settings: %s", settings)
         self.set_edit_files(settings.get("edit_files", []))
         self.set_original_search_paths(settings.get("original_search_paths", []))
         self.set_graded_search_paths(settings.get("graded_search_paths", []))
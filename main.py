@@ -1,6 +1,7 @@
 # main.py (Full Application - Test Import Order - Corrected)
 import sys
 import logging
+import logging.handlers
 import os
 
 # --- Determine App Directory FIRST ---
@@ -13,15 +14,40 @@ else:
 
 # --- Logging Setup ---
 log_file_path = os.path.join(app_dir, "timelineharvester_MAIN_ImportOrderTest.log") # Use a distinct log file name
+log_format = '%(asctime)s - %(name)s - %(levelname)s - [%(module)s.%(funcName)s] %(message)s'
+file_handler = logging.FileHandler(log_file_path, mode='w', encoding='utf-8') # Overwrite log for test
+file_handler.setFormatter(logging.Formatter(log_format)) # basicConfig only formats the buffering handler
+# Buffer file records so UI actions don't each pay a disk write; warnings and
+# errors flush straight away, and logging.shutdown() flushes the rest on exit
+buffered_file_handler = logging.handlers.MemoryHandler(capacity=512, flushLevel=logging.WARNING,
+                                                       target=file_handler)
+# DEBUG output is opt-in, so normal runs don't format and buffer debug records
+log_level = logging.DEBUG if os.environ.get("TLH_DEBUG") == "1" else logging.INFO
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(module)s.%(funcName)s] %(message)s',
+    level=log_level,
+    format=log_format,
     handlers=[
-        logging.FileHandler(log_file_path, mode='w', encoding='utf-8'), # Overwrite log for test
+        buffered_file_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger("TimelineHarvesterApp") # Use main logger name
+
+
+def log_unhandled_exception(exc_type, exc_value, exc_traceback):
+    """Logs an uncaught exception, flushes the buffered log file and exits."""
+    logger.critical("Unhandled exception", exc_info=(exc_type, exc_value, exc_traceback))
+    logging.shutdown()
+    sys.__excepthook__(exc_type, exc_value, exc_traceback)
+    # Still crash like PyQt's default abort, rather than run on in whatever
+    # state the failed slot left behind
+    os._exit(1)
+
+
+# PyQt aborts on an exception escaping a slot, which skips logging.shutdown()
+# and loses the buffered records; this hook flushes them first
+sys.excepthook = log_unhandled_exception
+
 logger.info("-" * 50)
 logger.info("--- Starting TimelineHarvester Application (Full - Import Order Test) ---")
 logger.info(f"Python Version: {sys.version}")
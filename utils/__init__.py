@@ -10,7 +10,8 @@ from .time_utils import (
     ensure_non_negative_time,
     rescale_time,
     duration_to_seconds,
-    frames_to_rational_time
+    frames_to_rational_time,
+    format_time
 )
 
 from .handle_utils import (
@@ -26,6 +27,7 @@ __all__ = [
     'rescale_time',
     'duration_to_seconds',
     'frames_to_rational_time',
+    'format_time',
     'normalize_handles',
     'apply_handles_to_range',
     'find_executable'
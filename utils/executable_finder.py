@@ -26,7 +26,7 @@ def find_executable(name: str) -> Optional[str]:
     # --- 1. Check if bundled (PyInstaller) ---
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         bundle_dir = sys._MEIPASS
-        logger.debug(f"Running bundled, checking base bundle dir: {bundle_dir}")
+        logger.debug("Running bundled, checking base bundle dir: %s", bundle_dir)
         exe_path = os.path.join(bundle_dir, executable_name)
         if os.path.exists(exe_path):
             found_path = exe_path
@@ -59,14 +59,14 @@ def find_executable(name: str) -> Optional[str]:
 
         relative_subfolder = "ffmpeg_bin"  # Conventional name
         exe_path = os.path.join(script_dir, relative_subfolder, executable_name)
-        logger.debug(f"Not bundled, checking relative subfolder: {exe_path}")
+        logger.debug("Not bundled, checking relative subfolder: %s", exe_path)
         if os.path.exists(exe_path):
             found_path = exe_path
             logger.info(f"Found '{name}' in relative subfolder '{relative_subfolder}'.")
 
     # --- 3. Fallback to system PATH ---
     if not found_path:
-        logger.debug(f"'{name}' not found in bundle or relative subfolder, checking system PATH.")
+        logger.debug("'%s' not found in bundle or relative subfolder, checking system PATH.", name)
         exe_path = shutil.which(name)
         if exe_path:
             found_path = exe_path
@@ -7,6 +7,8 @@ used across the TimelineHarvester application.
 """
 
 import logging
+import math
+from functools import lru_cache
 from typing import Optional, Union
 import opentimelineio as otio
 
@@ -99,3 +101,43 @@ def frames_to_rational_time(frames: int, rate: float) -> otio.opentime.RationalT
         raise ValueError("Frame rate must be positive.")
     # Ensure frames is integer
     return otio.opentime.RationalTime(int(frames), rate)
+
+
+def format_time(time_value: Optional[otio.opentime.RationalTime], rate: Optional[float]) -> str:
+    """
+    Formats a RationalTime for display as a timecode string.
+
+    Args:
+        time_value: The time to format.
+        rate: Frame rate to express the time in.
+
+    Returns:
+        The timecode, 'N/A' if the time or rate is missing, or the time
+        in seconds if it cannot be expressed at the rate.
+    """
+    if time_value is None or not rate:
+        return "N/A"
+    try:
+        return _cached_timecode(time_value.value, time_value.rate, rate)
+    except Exception:
+        return f"{time_value.to_seconds():.3f}s"
+
+
+# Whole SMPTE rates, formatted without calling into OTIO
+_NON_DROP_RATES = frozenset((24, 25, 30, 48, 50, 60))
+
+
+# Edits reuse the same times and rates heavily, so repeated conversions
+# are answered from a dict instead of calling into OTIO again.
+@lru_cache(maxsize=65536)
+def _cached_timecode(value: float, time_rate: float, rate: float) -> str:
+    if value >= 0 and rate in _NON_DROP_RATES:
+        # Non-drop timecode is a plain split of the frame count. Matches
+        # to_timecode, which floors the frame and wraps at 24 hours.
+        fps = int(rate)
+        frames = int(math.floor(value if time_rate == rate else value * rate / time_rate))
+        total_seconds, ff = divmod(frames, fps)
+        total_minutes, ss = divmod(total_seconds, 60)
+        hh, mm = divmod(total_minutes, 60)
+        return f"{hh % 24:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
+    return otio.opentime.to_timecode(otio.opentime.RationalTime(value, time_rate), rate)